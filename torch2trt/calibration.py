@@ -1,13 +1,26 @@
+import os
 import torch
 import tensorrt as trt
 
 
-if trt.__version__ >= '5.1':
+if hasattr(trt.CalibrationAlgoType, 'ENTROPY_CALIBRATION_2'):
     DEFAULT_CALIBRATION_ALGORITHM = trt.CalibrationAlgoType.ENTROPY_CALIBRATION_2
 else:
     DEFAULT_CALIBRATION_ALGORITHM = trt.CalibrationAlgoType.ENTROPY_CALIBRATION
     
 
+def default_calibration_batch_size(dataset_len, max_batch_size, cap=32):
+    """Largest batch size up to min(max_batch_size, cap) that divides the dataset length
+
+    get_batch wraps around to fill the last batch, so a batch size that does not divide the
+    dataset would feed some samples to the calibrator twice.
+    """
+    for batch_size in range(min(max_batch_size, cap, dataset_len), 1, -1):
+        if dataset_len % batch_size == 0:
+            return batch_size
+    return 1
+    
+    
 class TensorBatchDataset():
     
     def __init__(self, tensors):
@@ -22,14 +35,15 @@ class TensorBatchDataset():
     
 class DatasetCalibrator(trt.IInt8Calibrator):
     
-    def __init__(self, inputs, dataset, batch_size=1, algorithm=DEFAULT_CALIBRATION_ALGORITHM):
+    def __init__(self, inputs, dataset, batch_size=1, algorithm=DEFAULT_CALIBRATION_ALGORITHM, cache_file=None):
         super(DatasetCalibrator, self).__init__()
         
         self.dataset = dataset
         self.batch_size = batch_size
         self.algorithm = algorithm
+        self.cache_file = cache_file
         
-        # create buffers that will hold data batches
+        # create buffers that will hold data batches, these are reused for every batch
         self.buffers = []
         for tensor in inputs:
             size = (batch_size,) + tuple(tensor.shape[1:])
@@ -63,7 +77,13 @@ class DatasetCalibrator(trt.IInt8Calibrator):
         return self.batch_size
     
     def read_calibration_cache(self, *args, **kwargs):
+        # calibration is skipped entirely when a cache from a previous build exists
+        if self.cache_file is not None and os.path.exists(self.cache_file):
+            with open(self.cache_file, 'rb') as f:
+                return f.read()
         return None
     
     def write_calibration_cache(self, cache, *args, **kwargs):
-        pass
\ No newline at end of file
+        if self.cache_file is not None:
+            with open(self.cache_file, 'wb') as f:
+                f.write(cache)
\ No newline at end of file
@@ -1,7 +1,7 @@
 from torch2trt.torch2trt import *
 from torch2trt.module_test import add_module_test
 
-@tensorrt_converter("torch.nn.ConvTranspose2d.forward", enabled=trt_version() < '7.0')
+@tensorrt_converter("torch.nn.ConvTranspose2d.forward", enabled=not trt_version_ge('7.0'))
 def convert_ConvTranspose2d(ctx):
     module = ctx.method_args[0]
     input = ctx.method_args[1]
@@ -49,20 +49,20 @@ def convert_ConvTranspose2d(ctx):
     output._trt = layer.get_output(0)
 
     
-@add_module_test(torch.float32, torch.device("cuda"), [(1,3,224,224)], enabled=trt_version() < '7.0')
+@add_module_test(torch.float32, torch.device("cuda"), [(1,3,224,224)], enabled=not trt_version_ge('7.0'))
 def test_square_kernel_equal_stride_mode():
     return torch.nn.ConvTranspose2d(3,3,3,stride=2)
 
-@add_module_test(torch.float32, torch.device("cuda"), [(1,3,224,224)], enabled=trt_version() < '7.0')
+@add_module_test(torch.float32, torch.device("cuda"), [(1,3,224,224)], enabled=not trt_version_ge('7.0'))
 def test_square_kernel_equal_stride_mode_unequal_op_size():
     return torch.nn.ConvTranspose2d(3,6,3,stride=2)
 
-@add_module_test(torch.float32, torch.device("cuda"), [(1,3,224,224)], enabled=trt_version() < '7.0')
+@add_module_test(torch.float32, torch.device("cuda"), [(1,3,224,224)], enabled=not trt_version_ge('7.0'))
 def test_unequal_stride_mode():
     return torch.nn.ConvTranspose2d(3,3,3, stride=(2,1), padding=(4,2))
 
-@add_module_test(torch.float32, torch.device("cuda"), [(1,3,112,112)], enabled=trt_version() < '7.0')
-@add_module_test(torch.float32, torch.device("cuda"), [(1,3,7,7)], enabled=trt_version() < '7.0')
+@add_module_test(torch.float32, torch.device("cuda"), [(1,3,112,112)], enabled=not trt_version_ge('7.0'))
+@add_module_test(torch.float32, torch.device("cuda"), [(1,3,7,7)], enabled=not trt_version_ge('7.0'))
 def test_kernelsize_4():
     return torch.nn.ConvTranspose2d(3,3,4, stride=2, padding=1)
 
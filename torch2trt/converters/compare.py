@@ -10,18 +10,18 @@ def convert_elementwise(ctx, op):
     layer = ctx.network.add_elementwise(input_a_trt, input_b_trt, op)
     output._trt = layer.get_output(0)
 
-@tensorrt_converter('torch.gt', enabled=trt_version() >= '7.0')
-@tensorrt_converter('torch.Tensor.__gt__', enabled=trt_version() >= '7.0')
+@tensorrt_converter('torch.gt', enabled=trt_version_ge('7.0'))
+@tensorrt_converter('torch.Tensor.__gt__', enabled=trt_version_ge('7.0'))
 def convert_gt(ctx):
     return convert_elementwise(ctx, trt.ElementWiseOperation.GREATER)
 
-@tensorrt_converter('torch.lt', enabled=trt_version() >= '7.0')
-@tensorrt_converter('torch.Tensor.__lt__', enabled=trt_version() >= '7.0')
+@tensorrt_converter('torch.lt', enabled=trt_version_ge('7.0'))
+@tensorrt_converter('torch.Tensor.__lt__', enabled=trt_version_ge('7.0'))
 def convert_gt(ctx):
     return convert_elementwise(ctx, trt.ElementWiseOperation.LESS)
 
-@tensorrt_converter('torch.eq', enabled=trt_version() >= '7.0')
-@tensorrt_converter('torch.Tensor.__eq__', enabled=trt_version() >= '7.0')
+@tensorrt_converter('torch.eq', enabled=trt_version_ge('7.0'))
+@tensorrt_converter('torch.Tensor.__eq__', enabled=trt_version_ge('7.0'))
 def convert_gt(ctx):
     return convert_elementwise(ctx, trt.ElementWiseOperation.EQUAL)
 
@@ -47,14 +47,14 @@ class EQ(torch.nn.Module):
         return x == y
 
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1, 3, 6, 6), (1, 3, 6, 6)], enabled=trt_version() >= '7.0')
+@add_module_test(torch.float32, torch.device('cuda'), [(1, 3, 6, 6), (1, 3, 6, 6)], enabled=trt_version_ge('7.0'))
 def test_gt_basic():
     return GT()
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1, 3, 6, 6), (1, 3, 6, 6)], enabled=trt_version() >= '7.0')
+@add_module_test(torch.float32, torch.device('cuda'), [(1, 3, 6, 6), (1, 3, 6, 6)], enabled=trt_version_ge('7.0'))
 def test_gt_basic():
     return LT()
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1, 3, 6, 6), (1, 3, 6, 6)], enabled=trt_version() >= '7.0')
+@add_module_test(torch.float32, torch.device('cuda'), [(1, 3, 6, 6), (1, 3, 6, 6)], enabled=trt_version_ge('7.0'))
 def test_gt_basic():
     return EQ()
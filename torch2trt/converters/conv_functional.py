@@ -2,8 +2,8 @@ from torch2trt.torch2trt import *
 from torch2trt.module_test import add_module_test
 
 
-@tensorrt_converter('torch.nn.functional.conv2d', enabled=trt_version() >= '7.0')
-@tensorrt_converter('torch.nn.functional.conv3d', enabled=trt_version() >= '7.0')
+@tensorrt_converter('torch.nn.functional.conv2d', enabled=trt_version_ge('7.0'))
+@tensorrt_converter('torch.nn.functional.conv3d', enabled=trt_version_ge('7.0'))
 def convert_Conv_trt7_functional(ctx):
     input = get_arg(ctx, 'input', pos=0, default=None)
     weight = get_arg(ctx, 'weight', pos=1, default=None)
@@ -87,41 +87,41 @@ class FunctionalConv3d(torch.nn.Module):
         )
         return x
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 224, 224)], enabled=trt_version() >= '7.0')
+@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 224, 224)], enabled=trt_version_ge('7.0'))
 def test_Conv2d_basic_trt7_functional():
     return FunctionalConv2d(10, 5, kernel_size=1, stride=1, padding=0)
 
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 224, 224)], enabled=trt_version() >= '7.0')
+@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 224, 224)], enabled=trt_version_ge('7.0'))
 def test_Conv2d_stride2_trt7_functional():
     return FunctionalConv2d(10, 5, kernel_size=1, stride=2, padding=0)
 
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 224, 224)], enabled=trt_version() >= '7.0')
+@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 224, 224)], enabled=trt_version_ge('7.0'))
 def test_Conv2d_kernel3_trt7_functional():
     return FunctionalConv2d(10, 5, kernel_size=3, stride=2, padding=1)
 
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 224, 224)], enabled=trt_version() >= '7.0')
+@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 224, 224)], enabled=trt_version_ge('7.0'))
 def test_Conv2d_dilation2_trt7_functional():
     return FunctionalConv2d(10, 5, kernel_size=3, stride=1, padding=1, dilation=2)
 
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 64, 64, 64)], enabled=trt_version() >= '7.0')
+@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 64, 64, 64)], enabled=trt_version_ge('7.0'))
 def test_Conv3d_basic_trt7_functional():
     return FunctionalConv3d(10, 5, kernel_size=1, stride=1, padding=0)
 
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 64, 64, 64)], enabled=trt_version() >= '7.0')
+@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 64, 64, 64)], enabled=trt_version_ge('7.0'))
 def test_Conv3d_stride2_trt7_functional():
     return FunctionalConv3d(10, 5, kernel_size=1, stride=2, padding=0)
 
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 64, 64, 64)], enabled=trt_version() >= '7.0')
+@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 64, 64, 64)], enabled=trt_version_ge('7.0'))
 def test_Conv3d_kernel3_trt7_functional():
     return FunctionalConv3d(10, 5, kernel_size=3, stride=2, padding=1)
 
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 64, 64, 64)], enabled=trt_version() >= '7.0')
+@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 64, 64, 64)], enabled=trt_version_ge('7.0'))
 def test_Conv3d_dilation2_trt7_functional():
     return FunctionalConv3d(10, 5, kernel_size=3, stride=1, padding=1, dilation=2)
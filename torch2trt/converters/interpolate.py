@@ -21,7 +21,7 @@ def get_interpolate_plugin(size, mode, align_corners):
     return creator.deserialize_plugin(PLUGIN_NAME, torch2trt_plugin.serializeToString())
 
 
-@tensorrt_converter('torch.nn.functional.interpolate', enabled=trt_version() < '7.1' and has_interpolate_plugin())
+@tensorrt_converter('torch.nn.functional.interpolate', enabled=not trt_version_ge('7.1') and has_interpolate_plugin())
 def convert_interpolate_plugin(ctx):
     input = ctx.method_args[0]
     input_trt = add_missing_trt_tensors(ctx.network, [input])[0]
@@ -48,8 +48,8 @@ def convert_interpolate_plugin(ctx):
     output._trt = layer.get_output(0)
 
                                                   
-@tensorrt_converter('torch.nn.functional.interpolate', enabled=trt_version() >= '7.1')
-@tensorrt_converter('torch.nn.functional.upsample', enabled=trt_version() >= '7.1')
+@tensorrt_converter('torch.nn.functional.interpolate', enabled=trt_version_ge('7.1'))
+@tensorrt_converter('torch.nn.functional.upsample', enabled=trt_version_ge('7.1'))
 def convert_interpolate_trt7(ctx):                                     
     #parse args                     
     input = get_arg(ctx, 'input', pos=0, default=None) 
@@ -86,7 +86,7 @@ def convert_interpolate_trt7(ctx):
         layer.resize_mode=trt.ResizeMode.NEAREST
 
     if align_corners != None:
-        if trt_version() >= '8.0':
+        if trt_version_ge('8.0'):
             layer.coordinate_transformation = trt.ResizeCoordinateTransformation.ALIGN_CORNERS
         else:
             layer.align_corners = align_corners
@@ -104,78 +104,78 @@ class Interpolate(torch.nn.Module):
         return F.interpolate(x, self.size, mode=self.mode, align_corners=self.align_corners)
 
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 112, 112)], enabled=trt_version() < '7.1' and has_interpolate_plugin())
+@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 112, 112)], enabled=not trt_version_ge('7.1') and has_interpolate_plugin())
 def test_interpolate_nearest():
     return Interpolate((224, 224), 'nearest', None)
 
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 112, 112)], enabled=trt_version() < '7.1' and has_interpolate_plugin())
+@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 112, 112)], enabled=not trt_version_ge('7.1') and has_interpolate_plugin())
 def test_interpolate_bilinear():
     return Interpolate((224, 224), 'bilinear', False)
 
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 112, 112)], enabled=trt_version() < '7.1' and has_interpolate_plugin())
+@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 112, 112)], enabled=not trt_version_ge('7.1') and has_interpolate_plugin())
 def test_interpolate_bicubic():
     return Interpolate((224, 224), 'bicubic', False)
 
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 112, 112)], enabled=trt_version() < '7.1' and has_interpolate_plugin())
+@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 112, 112)], enabled=not trt_version_ge('7.1') and has_interpolate_plugin())
 def test_interpolate_area():
     return Interpolate((56, 56), 'area', None)
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 112, 112)], enabled=trt_version() < '7.1' and has_interpolate_plugin())
+@add_module_test(torch.float32, torch.device('cuda'), [(1, 10, 112, 112)], enabled=not trt_version_ge('7.1') and has_interpolate_plugin())
 def test_upsample_scale_factor2():
     return nn.Upsample(scale_factor=2, mode='bilinear',align_corners=False)
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1,2,12,12)], enabled=trt_version() >= '7.1')
+@add_module_test(torch.float32, torch.device('cuda'), [(1,2,12,12)], enabled=trt_version_ge('7.1'))
 def test_nearest_mode():
     return torch.nn.Upsample(scale_factor=2, mode="nearest")
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1,4,12,12)], enabled=trt_version() >= '7.1')
+@add_module_test(torch.float32, torch.device('cuda'), [(1,4,12,12)], enabled=trt_version_ge('7.1'))
 def test_bilinear_mode():
     return torch.nn.Upsample(scale_factor=3, mode="bilinear",align_corners=False)
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1,3,12,12)], enabled=trt_version() >= '7.1')
+@add_module_test(torch.float32, torch.device('cuda'), [(1,3,12,12)], enabled=trt_version_ge('7.1'))
 def test_align_corner():
     return torch.nn.Upsample(scale_factor=2, mode="bilinear", align_corners=True)
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1,5,13,13)], enabled=trt_version() >= '7.1')
+@add_module_test(torch.float32, torch.device('cuda'), [(1,5,13,13)], enabled=trt_version_ge('7.1'))
 def test_bilinear_mode_odd_input_shape():
     return torch.nn.Upsample(scale_factor=2,mode="bilinear",align_corners=False)
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1,4,12,12)], enabled=trt_version() >= '7.1')
+@add_module_test(torch.float32, torch.device('cuda'), [(1,4,12,12)], enabled=trt_version_ge('7.1'))
 def test_size_parameter():
     return torch.nn.Upsample(size=3,mode="nearest")
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1,3,13,13)], enabled=trt_version() >= '7.1')
-@add_module_test(torch.float32, torch.device('cuda'), [(1,3,1,1)], enabled=trt_version() >= '7.1')
+@add_module_test(torch.float32, torch.device('cuda'), [(1,3,13,13)], enabled=trt_version_ge('7.1'))
+@add_module_test(torch.float32, torch.device('cuda'), [(1,3,1,1)], enabled=trt_version_ge('7.1'))
 def test_size_parameter_odd_input():
     return torch.nn.Upsample(size=[6,3],mode="nearest")
 
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1,4,6,6,6)], enabled=trt_version() >= '7.1')
+@add_module_test(torch.float32, torch.device('cuda'), [(1,4,6,6,6)], enabled=trt_version_ge('7.1'))
 def test_nearest_mode_3d():
     return torch.nn.Upsample(scale_factor=2, mode="nearest")
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1,3,5,5,5)], enabled=trt_version() >= '7.1')
+@add_module_test(torch.float32, torch.device('cuda'), [(1,3,5,5,5)], enabled=trt_version_ge('7.1'))
 def test_bilinear_mode_3d():
     return torch.nn.Upsample(scale_factor=3, mode="trilinear",align_corners=False)
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1,4,8,8,8)], enabled=trt_version() >= '7.1')
+@add_module_test(torch.float32, torch.device('cuda'), [(1,4,8,8,8)], enabled=trt_version_ge('7.1'))
 def test_align_corner_3d():
     return torch.nn.Upsample(scale_factor=4, mode="trilinear", align_corners=True)
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1,6,7,7,7)], enabled=trt_version() >= '7.1')
-@add_module_test(torch.float32, torch.device('cuda'), [(1,3,2,4,4)], enabled=trt_version() >= '7.1')
-@add_module_test(torch.float32, torch.device('cuda'), [(1,3,1,1,1)], enabled=trt_version() >= '7.1')
+@add_module_test(torch.float32, torch.device('cuda'), [(1,6,7,7,7)], enabled=trt_version_ge('7.1'))
+@add_module_test(torch.float32, torch.device('cuda'), [(1,3,2,4,4)], enabled=trt_version_ge('7.1'))
+@add_module_test(torch.float32, torch.device('cuda'), [(1,3,1,1,1)], enabled=trt_version_ge('7.1'))
 def test_bilinear_mode_odd_input_shape_3d():
     return torch.nn.Upsample(scale_factor=2, mode="trilinear",align_corners=False)
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1,1,12,12,12)], enabled=trt_version() >= '7.1')
+@add_module_test(torch.float32, torch.device('cuda'), [(1,1,12,12,12)], enabled=trt_version_ge('7.1'))
 def test_size_parameter_3d():
     return torch.nn.Upsample(size=3,mode="trilinear", align_corners=True)
 
-@add_module_test(torch.float32, torch.device('cuda'), [(1,3,7,9,5)], enabled=trt_version() >= '7.1')
-@add_module_test(torch.float32, torch.device('cuda'), [(1,4,3,5,1)], enabled=trt_version() >= '7.1')
+@add_module_test(torch.float32, torch.device('cuda'), [(1,3,7,9,5)], enabled=trt_version_ge('7.1'))
+@add_module_test(torch.float32, torch.device('cuda'), [(1,4,3,5,1)], enabled=trt_version_ge('7.1'))
 def test_size_parameter_odd_input_3d():
     return torch.nn.Upsample(size=[11,14,17],mode="trilinear", align_corners=False)
@@ -47,8 +47,7 @@ def convert_layernorm(ctx):
     if isinstance(shape, int):
         shape = (shape,)
     dim = tuple([-i - 1 for i in range(len(shape))])
-    dim = torch_dim_resolve_negative(dim, len(input.shape))
-    axes = torch_dim_to_trt_axes(dim)
+    axes = torch_dim_to_trt_axes(dim, len(input.shape))
     
     ux = ctx.network.add_reduce(input_trt, trt.ReduceOperation.AVG, axes, keep_dims=True).get_output(0)
     numerator = ctx.network.add_elementwise(input_trt, ux, trt.ElementWiseOperation.SUB).get_output(0)
@@ -2,7 +2,7 @@ from torch2trt.torch2trt import *
 from torch2trt.module_test import add_module_test
 
 
-@tensorrt_converter("torch.transpose", enabled=trt_version() < '7.0')
+@tensorrt_converter("torch.transpose", enabled=not trt_version_ge('7.0'))
 def convert_transpose(ctx):
     input = ctx.method_args[0]
     input_trt = add_missing_trt_tensors(ctx.network, [input])[0]
@@ -18,7 +18,7 @@ def convert_transpose(ctx):
     output._trt = layer.get_output(0)
 
 
-@tensorrt_converter('torch.transpose', enabled=trt_version() >= '7.0')
+@tensorrt_converter('torch.transpose', enabled=trt_version_ge('7.0'))
 def convert_transpose_trt7(ctx):
     input = ctx.method_args[0]
     input_trt = add_missing_trt_tensors(ctx.network, [input])[0]
@@ -0,0 +1,38 @@
+import torch
+from torch2trt.calibration import DatasetCalibrator, default_calibration_batch_size
+
+
+class CountingDataset():
+
+    def __init__(self, size):
+        self.size = size
+        self.visits = [0] * size
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, idx):
+        self.visits[idx] += 1
+        return [torch.full((3,), float(idx))]
+
+
+def _calibrate(dataset, batch_size):
+    inputs = [torch.zeros((1, 3))]
+    calibrator = DatasetCalibrator(inputs, dataset, batch_size=batch_size)
+    while calibrator.get_batch():
+        pass
+
+
+def test_default_calibration_batch_size_visits_each_sample_once():
+    for dataset_len, max_batch_size in [(100, 64), (64, 32), (97, 32), (10, 1), (6, 32)]:
+        dataset = CountingDataset(dataset_len)
+        batch_size = default_calibration_batch_size(dataset_len, max_batch_size)
+        assert 1 <= batch_size <= min(max_batch_size, 32)
+        _calibrate(dataset, batch_size)
+        assert dataset.visits == [1] * dataset_len, (dataset_len, max_batch_size, batch_size)
+
+
+def test_default_calibration_batch_size_largest_divisor():
+    assert default_calibration_batch_size(100, 64) == 25
+    assert default_calibration_batch_size(64, 32) == 32
+    assert default_calibration_batch_size(97, 32) == 1
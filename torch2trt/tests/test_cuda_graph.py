@@ -0,0 +1,31 @@
+import torch
+from torch2trt import torch2trt, TRTModule
+
+
+def test_cuda_graph():
+    net = torch.nn.Sequential(
+        torch.nn.Conv2d(3, 10, kernel_size=3),
+        torch.nn.ReLU()
+    )
+    net.eval().cuda()
+
+    data = torch.randn((2, 3, 25, 25)).cuda()
+
+    with torch.no_grad():
+        trt_net = torch2trt(net, [data], max_batch_size=2)
+        trt_net_graph = TRTModule(trt_net.engine, trt_net.input_names, trt_net.output_names, use_cuda_graph=True)
+
+        # second batch size forces the graph to be recaptured
+        outs = []
+        for batch_size in [1, 2, 1]:
+            test_tensor = torch.randn((batch_size, 3, 25, 25)).cuda()
+            test_out = trt_net(test_tensor)
+            test_graph_out = trt_net_graph(test_tensor)
+            outs.append((test_graph_out, test_graph_out.clone()))
+
+            delta = (test_out - test_graph_out).abs().max()
+            assert delta < 1e-3, f"Delta: {delta}"
+
+    # outputs returned earlier must not be overwritten by later replays
+    for out, out_copy in outs:
+        assert torch.equal(out, out_copy)
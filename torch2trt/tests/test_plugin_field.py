@@ -0,0 +1,33 @@
+import numpy as np
+import tensorrt as trt
+from torch2trt.torch2trt import _plugin_field
+
+
+def test_plugin_field_float_is_float32():
+    field, array = _plugin_field('scale', 0.125)
+    assert array.dtype == np.float32
+    assert field.type == trt.PluginFieldType.FLOAT32
+
+
+def test_plugin_field_int_is_int32():
+    field, array = _plugin_field('size', [1, 2, 3])
+    assert array.dtype == np.int32
+    assert field.type == trt.PluginFieldType.INT32
+
+
+def test_plugin_field_bool_is_int32():
+    field, array = _plugin_field('causal', True)
+    assert array.dtype == np.int32 and int(array) == 1
+    assert field.type == trt.PluginFieldType.INT32
+
+
+def test_plugin_field_float16_is_kept():
+    field, array = _plugin_field('weight', np.ones(4, dtype=np.float16))
+    assert array.dtype == np.float16
+    assert field.type == trt.PluginFieldType.FLOAT16
+
+
+def test_plugin_field_str_is_char():
+    field, array = _plugin_field('mode', 'linear')
+    assert bytes(array[:-1].tobytes()) == b'linear' and array[-1] == 0
+    assert field.type == trt.PluginFieldType.CHAR
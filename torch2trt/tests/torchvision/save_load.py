@@ -21,4 +21,15 @@ if __name__ == '__main__':
     assert(model_trt_2.engine is not None)
     
     print(torch.max(torch.abs(model_trt_2(data) - model(data))))
-    print(torch.max(torch.abs(model_trt_2(data) - model_trt(data))))
\ No newline at end of file
+    print(torch.max(torch.abs(model_trt_2(data) - model_trt(data))))
+
+    print('Loading model from bytearray checkpoint...')
+    state_dict = model_trt.state_dict()
+    assert(isinstance(state_dict['engine'], torch.Tensor) and state_dict['engine'].dtype == torch.uint8)
+    state_dict['engine'] = bytearray(state_dict['engine'].numpy().tobytes())  # format of older checkpoints
+    model_trt_3 = TRTModule()
+    model_trt_3.load_state_dict(state_dict)
+
+    assert(model_trt_3.engine is not None)
+
+    print(torch.max(torch.abs(model_trt_3(data) - model_trt(data))))
@@ -1,57 +1,81 @@
 import torch
 import tensorrt as trt
 import copy
+import functools
 import numpy as np
 import io
-from collections import defaultdict
+import os
 import importlib
+import re
+import threading
+import warnings
 
 from .calibration import (
     TensorBatchDataset,
     DatasetCalibrator,
     DEFAULT_CALIBRATION_ALGORITHM,
+    default_calibration_batch_size,
 )
 
 # UTILITY FUNCTIONS
 
 
+_TRT_VERSION = trt.__version__
+_TORCH_VERSION = torch.__version__
+
+
+def _version_tuple(version):
+    """Parses the (major, minor) numbers of a version string, so '10.0' compares above '8.0'"""
+    major, minor = re.match(r'(\d+)\.(\d+)', version).groups()
+    return (int(major), int(minor))
+
+
+
+
 def trt_version():
-    return trt.__version__
+    return _TRT_VERSION
+
+
+def trt_version_ge(version):
+    """Returns True if the installed TensorRT is at least ``version``, e.g. ``trt_version_ge('7.1')``"""
+    return _version_tuple(_TRT_VERSION) >= _version_tuple(version)
 
 
 def torch_version():
-    return torch.__version__
+    return _TORCH_VERSION
+
+
+_TORCH_TO_TRT = {
+    torch.int8: trt.int8,
+    torch.int32: trt.int32,
+    torch.float16: trt.float16,
+    torch.float32: trt.float32,
+    torch.int64: trt.int32,
+}
+
+_TRT_TO_TORCH = {
+    trt.int8: torch.int8,
+    trt.int32: torch.int32,
+    trt.float16: torch.float16,
+    trt.float32: torch.float32,
+}
+
+if trt_version_ge('7.0'):
+    _TORCH_TO_TRT[torch.bool] = trt.bool
+    _TRT_TO_TORCH[trt.bool] = torch.bool
 
 
 def torch_dtype_to_trt(dtype):
-    if trt_version() >= '7.0' and dtype == torch.bool:
-        return trt.bool
-    elif dtype == torch.int8:
-        return trt.int8
-    elif dtype == torch.int32:
-        return trt.int32
-    elif dtype == torch.float16:
-        return trt.float16
-    elif dtype == torch.float32:
-        return trt.float32
-    elif dtype == torch.int64:
-        return trt.int32
-    else:
+    try:
+        return _TORCH_TO_TRT[dtype]
+    except KeyError:
         raise TypeError("%s is not supported by tensorrt" % dtype)
 
 
 def torch_dtype_from_trt(dtype):
-    if dtype == trt.int8:
-        return torch.int8
-    elif trt_version() >= '7.0' and dtype == trt.bool:
-        return torch.bool
-    elif dtype == trt.int32:
-        return torch.int32
-    elif dtype == trt.float16:
-        return torch.float16
-    elif dtype == trt.float32:
-        return torch.float32
-    else:
+    try:
+        return _TRT_TO_TORCH[dtype]
+    except KeyError:
         raise TypeError("%s is not supported by torch" % dtype)
 
 
@@ -89,33 +113,70 @@ def trt_num_outputs(engine):
     return count
 
 
+@functools.lru_cache(maxsize=512)
+def _torch_dim_resolve_negative(dim, ndim):
+    return tuple([d + ndim if d < 0 else d for d in dim])
+
+
 def torch_dim_resolve_negative(dim, ndim):
     if not isinstance(dim, tuple):
         dim = (dim,)
-    pos = []
+    return _torch_dim_resolve_negative(dim, ndim)
+
+
+@functools.lru_cache(maxsize=512)
+def _torch_dim_to_trt_axes(dim, ndim):
+    axes = 0
     for d in dim:
-        if d < 0:
-            d = ndim + d
-        pos.append(d)
-    return tuple(pos)
+        if d < 0 and ndim is not None:
+            d = d + ndim
+        axes |= 1 << (d - 1)  # -1 to remove batch dimension
+    return axes
+
 
+def torch_dim_to_trt_axes(dim, ndim=None):
+    """Converts torch dim, or tuple of dims to a tensorrt axes bitmask
 
-def torch_dim_to_trt_axes(dim):
-    """Converts torch dim, or tuple of dims to a tensorrt axes bitmask"""
+    If ndim is given, negative dims are resolved against it in the same pass.
+    """
     if not isinstance(dim, tuple):
         dim = (dim,)
+    return _torch_dim_to_trt_axes(dim, ndim)
 
-    # create axes bitmask for reduce layer
-    axes = 0
-    for d in dim:
-        axes |= 1 << (d - 1)  # -1 to remove batch dimension
 
-    return axes
+_TORCH_TO_NP = {
+    torch.bool: np.bool_,
+    torch.int8: np.int8,
+    torch.int32: np.int32,
+    torch.int64: np.int64,
+    torch.float16: np.float16,
+    torch.float32: np.float32,
+    torch.float64: np.float64,
+}
+
+
+def _full_scalar(shape, value, dtype):
+    """Creates a numpy array of shape filled with a python scalar, in the numpy dtype matching dtype"""
+    try:
+        np_dtype = _TORCH_TO_NP[dtype]
+    except KeyError:
+        raise TypeError("%s is not supported for scalar constants" % dtype)
+    if np.issubdtype(np_dtype, np.integer) and isinstance(value, float) and not value.is_integer():
+        raise TypeError("Cannot create a %s constant from non-integral scalar %s" % (dtype, value))
+    return np.full(shape, value, dtype=np_dtype)
+
+
+def _as_weights(tensor):
+    """Returns a contiguous numpy view of the tensor, only copying to host if it lives on another device"""
+    tensor = tensor.detach().contiguous()
+    if tensor.device.type != "cpu":
+        tensor = tensor.cpu()
+    return tensor.numpy()
 
 
 def add_trt_constant(network, tensor):
     shape = tuple(tensor.shape[1:])
-    array = tensor[0].detach().cpu().numpy()
+    array = _as_weights(tensor[0])
     layer = network.add_constant(shape, array)
     return layer.get_output(0)
 
@@ -149,7 +210,7 @@ def add_missing_trt_tensors(network, tensors):
         # or... add constant for scalar primitive
         if isinstance(t, float) or isinstance(t, int):
             shape = (1,)
-            scalar = t * torch.ones(shape, dtype=dtype).cpu().numpy()
+            scalar = _full_scalar(shape, t, dtype)
             trt_tensor = network.add_constant(shape, scalar).get_output(0)
         elif hasattr(t, "_trt"):
             trt_tensor = t._trt
@@ -166,7 +227,7 @@ def add_missing_trt_tensors(network, tensors):
                     break
             shape = tuple(t.shape[num_preceding_ones:])
             
-            weight = t.detach().cpu().numpy()
+            weight = _as_weights(t)
             t._trt = network.add_constant(shape, weight).get_output(0)
             trt_tensor = t._trt
 
@@ -178,25 +239,20 @@ def add_missing_trt_tensors(network, tensors):
     return trt_tensors
     
 
+def _broadcast_trt_tensor(network, trt_tensor, broadcast_ndim):
+    """Pre-pads the shape of a TensorRT tensor with 1 size dims, if it has fewer than broadcast_ndim dims"""
+    shape = tuple(trt_tensor.shape)
+    diff = broadcast_ndim - len(shape)
+    if diff <= 0:
+        return trt_tensor
+    layer = network.add_shuffle(trt_tensor)
+    layer.reshape_dims = (1,) * diff + shape
+    return layer.get_output(0)
+
+
 def broadcast_trt_tensors(network, trt_tensors, broadcast_ndim):
     """Broadcast TensorRT tensors to the specified dimension by pre-padding shape 1 dims"""
-    broadcasted_trt_tensors = [None] * len(trt_tensors)
-    
-    for i, t in enumerate(trt_tensors):
-        
-        if len(t.shape) < broadcast_ndim:
-            # append 1 size dims to front
-            diff = broadcast_ndim - len(t.shape)
-            shape = tuple([1] * diff + list(t.shape))
-            layer = network.add_shuffle(t)
-            layer.reshape_dims = shape
-            trt_tensor = layer.get_output(0)
-        else:
-            trt_tensor = t
-
-        broadcasted_trt_tensors[i] = trt_tensor
-        
-    return broadcasted_trt_tensors
+    return [_broadcast_trt_tensor(network, t, broadcast_ndim) for t in trt_tensors]
     
     
 def trt_(network, *tensors):
@@ -231,29 +287,21 @@ def trt_(network, *tensors):
         elif isinstance(t, torch.Tensor) and not hasattr(t, "_trt"):
             # add leaf tensor
             shape = tuple(t.shape)  #  don't exclude batch when adding constants...?
-            weight = t.detach().cpu().numpy()
+            weight = _as_weights(t)
             t._trt = network.add_constant(shape, weight).get_output(0)
             trt_tensor = t._trt
 
         # or... add constant for scalar primitive
         elif isinstance(t, float) or isinstance(t, int):
             shape = (1,) * broadcast_num_dim
-            scalar = t * torch.ones(shape, dtype=dtype).cpu().numpy()
+            scalar = _full_scalar(shape, t, dtype)
             trt_tensor = network.add_constant(shape, scalar).get_output(0)
 
         assert trt_tensor is not None
 
         # MAKE TRT TENSOR BROADCASTABLE IF IT IS NOT ALREADY
 
-        if len(trt_tensor.shape) < broadcast_num_dim:
-            # append 1 size dims to front
-            diff = broadcast_num_dim - len(trt_tensor.shape)
-            shape = tuple([1] * diff + list(trt_tensor.shape))
-            layer = network.add_shuffle(trt_tensor)
-            layer.reshape_dims = shape
-            trt_tensor = layer.get_output(0)
-
-        trt_tensors[i] = trt_tensor
+        trt_tensors[i] = _broadcast_trt_tensor(network, trt_tensor, broadcast_num_dim)
 
     if len(trt_tensors) == 1:
         return trt_tensors[0]
@@ -265,6 +313,7 @@ def trt_(network, *tensors):
 
 
 CONVERTERS = {}
+_CONVERSION_LOCK = threading.RLock()
 
 
 def get_arg(ctx, name, pos, default):
@@ -313,7 +362,10 @@ def attach_converter(ctx, method, converter, method_str):
 
 
 class ConversionHook(object):
-    """Attaches TensorRT converter to PyTorch method call"""
+    """Attaches TensorRT converter to PyTorch method call
+
+    ConversionContext patches all converters itself, this is kept for code using hooks directly.
+    """
 
     def __init__(self, ctx, key, converter):
         self.ctx = ctx
@@ -321,8 +373,7 @@ class ConversionHook(object):
         self.converter = converter
 
     def _set_method(self, method):
-        module = self.converter['module']
-        exec('module.%s = method' % self.converter['qual_name'])
+        setattr(self.converter['parent'], self.converter['attr_name'], method)
 
     def __enter__(self):
         self._set_method(
@@ -345,15 +396,18 @@ class LayerNamingNetworkWrapper(object):
     def __init__(self, ctx, network):
         self._ctx = ctx
         self._network = network
-        self._layer_counts = defaultdict(lambda: 0)
+        self._layer_counts = {}
 
     def _set_layer_name(self, layer):
+        if not self._ctx.naming_enabled:
+            return
+
         def arg_str(arg):
             if isinstance(arg, torch.Tensor):
                 return "tensor(shape=%s, dtype=%s)" % (str(list(arg.shape)), str(arg.dtype))
             return str(arg)
 
-        self._layer_counts[layer.type.name] += 1
+        self._layer_counts[layer.type.name] = self._layer_counts.get(layer.type.name, 0) + 1
         args = [arg_str(arg) for arg in self._ctx.method_args]
         kwargs = ["%s=%s" % (key, arg_str(arg)) for key, arg in self._ctx.method_kwargs.items()]
         layer.name = "[%s #%d] %s(%s)" % (layer.type.name, self._layer_counts[layer.type.name],
@@ -382,19 +436,43 @@ class ConversionContext(object):
         self.method_kwargs = None
         self.method_return = None
         self.torch2trt_kwargs = torch2trt_kwargs
-        self.hooks = [
-            ConversionHook(self, key, converter)
-            for key, converter in converters.items()
+        # descriptive layer names are only worth building when TensorRT logs them
+        self.naming_enabled = torch2trt_kwargs is not None and \
+            int(torch2trt_kwargs.get('log_level', trt.Logger.ERROR)) >= int(trt.Logger.INFO)
+        # (owner, attribute, original method, wrapped method) for every converted method
+        self._patches = [
+            (
+                converter['parent'],
+                converter['attr_name'],
+                converter['method_impl'],
+                attach_converter(self, converter['method_impl'], converter, converter['method_str']),
+            )
+            for converter in converters.values()
         ]
 
     def __enter__(self):
-        for hook in self.hooks:
-            hook.__enter__()
+        # patched methods are global, so only one context may have them installed at a time
+        _CONVERSION_LOCK.acquire()
+        patched = []
+        try:
+            for patch in self._patches:
+                parent, attr_name, _, wrapper = patch
+                setattr(parent, attr_name, wrapper)
+                patched.append(patch)
+        except:
+            # __exit__ will not run, so undo the partial patch here
+            for parent, attr_name, method_impl, _ in reversed(patched):
+                setattr(parent, attr_name, method_impl)
+            _CONVERSION_LOCK.release()
+            raise
         return self
 
     def __exit__(self, type, val, tb):
-        for hook in self.hooks:
-            hook.__exit__(type, val, tb)
+        try:
+            for parent, attr_name, method_impl, _ in reversed(self._patches):
+                setattr(parent, attr_name, method_impl)
+        finally:
+            _CONVERSION_LOCK.release()
 
     def add_inputs(self, torch_inputs, names=None):
         if names is None:
@@ -424,17 +502,94 @@ class ConversionContext(object):
 
 
 class TRTModule(torch.nn.Module):
-    def __init__(self, engine=None, input_names=None, output_names=None):
+    def __init__(self, engine=None, input_names=None, output_names=None, use_cuda_graph=False):
         super(TRTModule, self).__init__()
         self._register_state_dict_hook(TRTModule._on_state_dict)
+        self.use_cuda_graph = use_cuda_graph
         self.engine = engine
         if self.engine is not None:
             self.context = self.engine.create_execution_context()
         self.input_names = input_names
         self.output_names = output_names
+        if self.engine is not None:
+            self._setup_bindings()
+
+    def _setup_bindings(self):
+        """Caches binding indices and output metadata, which are fixed once the engine is loaded"""
+        self._explicit_batch = trt_version_ge('7.0') and not self.engine.has_implicit_batch_dimension
+        self._input_idx = [self.engine.get_binding_index(name) for name in self.input_names]
+        self._input_devices = [torch_device_from_trt(self.engine.get_location(idx)) for idx in self._input_idx]
+        self._outputs_meta = []
+        for output_name in self.output_names:
+            idx = self.engine.get_binding_index(output_name)
+            self._outputs_meta.append((
+                idx,
+                torch_dtype_from_trt(self.engine.get_binding_dtype(idx)),
+                tuple(self.engine.get_binding_shape(idx)),
+                torch_device_from_trt(self.engine.get_location(idx)),
+            ))
+        self._bindings = [0] * self.engine.num_bindings
+        self._pinned_buffers = {}
+
+        # explicit batch engines with -1 input dims need their binding shapes set per input shape
+        self._dynamic_shapes = self._explicit_batch and any(
+            -1 in tuple(self.engine.get_binding_shape(idx)) for idx in self._input_idx)
+        self._last_input_shapes = None
+        self._output_shapes = None
+
+        self._cuda_graph = None
+        self._graph_input_shapes = None
+
+        # integrated GPUs (Jetson) share DRAM with the CPU, so pinned host inputs can be bound directly
+        self._zero_copy = torch.cuda.is_available() and torch.cuda.get_device_properties(
+            torch.cuda.current_device()).is_integrated
+
+    def _set_input_shapes(self, inputs):
+        """Sets the binding shapes of a dynamic shape engine, if they changed since the last call"""
+        input_shapes = tuple(tuple(input.shape) for input in inputs)
+        if input_shapes == self._last_input_shapes:
+            return
+        for name, idx, shape in zip(self.input_names, self._input_idx, input_shapes):
+            if not self.context.set_binding_shape(idx, shape):
+                self._last_input_shapes = None
+                raise ValueError("Shape %s of input %s is outside the engine's optimization profile" % (shape, name))
+        if not self.context.all_binding_shapes_specified:
+            self._last_input_shapes = None
+            raise ValueError("Input shapes %s do not specify all engine binding shapes" % (input_shapes,))
+        self._last_input_shapes = input_shapes
+        self._output_shapes = [tuple(self.context.get_binding_shape(meta[0])) for meta in self._outputs_meta]
+
+    def _stage_input(self, i, input):
+        """Copies a CPU input to the device of its binding through a reusable pinned host buffer
+
+        On integrated GPUs the pinned buffer itself is returned, to be bound as mapped host memory.  The
+        caller must then record the buffer's event once the engine has been enqueued.
+        """
+        if i not in self._pinned_buffers:
+            self._pinned_buffers[i] = (None, torch.cuda.Event())
+        pinned, event = self._pinned_buffers[i]
+
+        # the previous copy out of this buffer must finish before it is overwritten or replaced
+        event.synchronize()
+
+        # one buffer per input, reallocated when the input shape or dtype changes
+        if pinned is None or pinned.shape != input.shape or pinned.dtype != input.dtype:
+            pinned = torch.empty(size=input.shape, dtype=input.dtype, pin_memory=True)
+            self._pinned_buffers[i] = (pinned, event)
+        pinned.copy_(input)
+        if self._zero_copy:
+            return pinned
+        staged = pinned.to(self._input_devices[i], non_blocking=True)
+        event.record()
+        return staged
 
     def _on_state_dict(self, state_dict, prefix, local_metadata):
-        state_dict[prefix + "engine"] = bytearray(self.engine.serialize())
+        # wrap the serialized engine as a uint8 tensor without copying it, so torch.save
+        # writes it out as raw storage
+        engine_bytes = np.frombuffer(self.engine.serialize(), dtype=np.uint8)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")  # the serialized engine buffer is read-only
+            state_dict[prefix + "engine"] = torch.from_numpy(engine_bytes)
         state_dict[prefix + "input_names"] = self.input_names
         state_dict[prefix + "output_names"] = self.output_names
 
@@ -448,7 +603,10 @@ class TRTModule(torch.nn.Module):
         unexpected_keys,
         error_msgs,
     ):
+        # the engine is stored as a uint8 tensor, checkpoints from older versions store a bytearray
         engine_bytes = state_dict[prefix + "engine"]
+        if isinstance(engine_bytes, torch.Tensor):
+            engine_bytes = engine_bytes.cpu().numpy()
 
         with trt.Logger() as logger, trt.Runtime(logger) as runtime:
             self.engine = runtime.deserialize_cuda_engine(engine_bytes)
@@ -456,29 +614,95 @@ class TRTModule(torch.nn.Module):
 
         self.input_names = state_dict[prefix + "input_names"]
         self.output_names = state_dict[prefix + "output_names"]
+        self._setup_bindings()
 
-    def forward(self, *inputs):
-        batch_size = inputs[0].shape[0]
-        bindings = [None] * (len(self.input_names) + len(self.output_names))
-
-        # create output tensors
+    def _allocate_outputs(self, batch_size):
+        """Creates output tensors and points their bindings at them"""
         outputs = [None] * len(self.output_names)
-        for i, output_name in enumerate(self.output_names):
-            idx = self.engine.get_binding_index(output_name)
-            dtype = torch_dtype_from_trt(self.engine.get_binding_dtype(idx))
-            shape = (batch_size,) + tuple(self.engine.get_binding_shape(idx))
-            device = torch_device_from_trt(self.engine.get_location(idx))
+        for i, (idx, dtype, shape, device) in enumerate(self._outputs_meta):
+            if self._dynamic_shapes:
+                shape = self._output_shapes[i]
+            elif not self._explicit_batch:
+                shape = (batch_size,) + shape
             output = torch.empty(size=shape, dtype=dtype, device=device)
             outputs[i] = output
-            bindings[idx] = output.data_ptr()
+            self._bindings[idx] = output.data_ptr()
+        return outputs
 
-        for i, input_name in enumerate(self.input_names):
-            idx = self.engine.get_binding_index(input_name)
-            bindings[idx] = inputs[i].contiguous().data_ptr()
+    def _execute(self, batch_size, stream):
+        if self._explicit_batch:
+            self.context.execute_async_v2(self._bindings, stream)
+        else:
+            self.context.execute_async(batch_size, self._bindings, stream)
 
-        self.context.execute_async(
-            batch_size, bindings, torch.cuda.current_stream().cuda_stream
-        )
+    def _capture_cuda_graph(self, inputs):
+        """Captures the engine execution for the shapes of inputs into a CUDA graph with static I/O buffers"""
+        batch_size = inputs[0].shape[0]
+        self._cuda_graph = None
+
+        self._graph_inputs = [
+            torch.empty(size=input.shape, dtype=input.dtype, device=device)
+            for input, device in zip(inputs, self._input_devices)
+        ]
+        for idx, buffer in zip(self._input_idx, self._graph_inputs):
+            self._bindings[idx] = buffer.data_ptr()
+        self._graph_outputs = self._allocate_outputs(batch_size)
+
+        # run once outside of capture, so TensorRT performs any deferred allocations first
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream):
+            for buffer, input in zip(self._graph_inputs, inputs):
+                buffer.copy_(input)
+            self._execute(batch_size, stream.cuda_stream)
+        torch.cuda.current_stream().wait_stream(stream)
+
+        graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(graph, stream=stream):
+            self._execute(batch_size, stream.cuda_stream)
+
+        self._cuda_graph = graph
+        self._graph_input_shapes = tuple(tuple(input.shape) for input in inputs)
+
+    def _forward_cuda_graph(self, inputs):
+        input_shapes = tuple(tuple(input.shape) for input in inputs)
+        if self._cuda_graph is None or input_shapes != self._graph_input_shapes:
+            self._capture_cuda_graph(inputs)
+
+        for buffer, input in zip(self._graph_inputs, inputs):
+            buffer.copy_(input)
+        self._cuda_graph.replay()
+
+        # the graph always writes to the same buffers, so hand out copies
+        return [output.clone() for output in self._graph_outputs]
+
+    def forward(self, *inputs):
+        batch_size = inputs[0].shape[0]
+        bindings = self._bindings
+
+        if self._dynamic_shapes:
+            self._set_input_shapes(inputs)
+
+        if self.use_cuda_graph:
+            outputs = self._forward_cuda_graph(inputs)
+        else:
+            # create output tensors
+            outputs = self._allocate_outputs(batch_size)
+
+            inputs = list(inputs)
+            staged = []
+            for i, idx in enumerate(self._input_idx):
+                if inputs[i].device.type == "cpu" and self._input_devices[i].type == "cuda":
+                    inputs[i] = self._stage_input(i, inputs[i])
+                    staged.append(i)
+                bindings[idx] = inputs[i].contiguous().data_ptr()
+
+            self._execute(batch_size, torch.cuda.current_stream().cuda_stream)
+
+            if self._zero_copy:
+                # the engine reads staged inputs straight from their pinned buffers
+                for i in staged:
+                    self._pinned_buffers[i][1].record()
 
         outputs = tuple(outputs)
         if len(outputs) == 1:
@@ -504,8 +728,13 @@ def torch2trt(module,
               int8_mode=False, 
               int8_calib_dataset=None,
               int8_calib_algorithm=DEFAULT_CALIBRATION_ALGORITHM,
-              int8_calib_batch_size=1,
+              int8_calib_batch_size=None,
+              int8_calib_cache_file=None,
               use_onnx=False,
+              sparse_weights=False,
+              bf16_mode=False,
+              optimization_level=3,
+              timing_cache_path=None,
               **kwargs):
     
     # capture arguments to provide to context
@@ -525,20 +754,22 @@ def torch2trt(module,
     if not isinstance(inputs, tuple):
         inputs = (inputs,)
         
-    # run once to get num outputs
-    outputs = module(*inputs)
-    if not isinstance(outputs, tuple) and not isinstance(outputs, list):
-        outputs = (outputs,)
-        
     if input_names is None:
         input_names = default_input_names(len(inputs))
-    if output_names is None:
-        output_names = default_output_names(len(outputs))
         
     if use_onnx:
             
+        # run once to get num outputs
+        with torch.no_grad():
+            outputs = module(*inputs)
+        if not isinstance(outputs, tuple) and not isinstance(outputs, list):
+            outputs = (outputs,)
+        if output_names is None:
+            output_names = default_output_names(len(outputs))
+
         f = io.BytesIO()
-        torch.onnx.export(module, inputs, f, input_names=input_names, output_names=output_names)
+        with torch.no_grad():
+            torch.onnx.export(module, inputs, f, input_names=input_names, output_names=output_names)
         f.seek(0)
         onnx_bytes = f.read()
         network = builder.create_network(1 << int(trt.NetworkDefinitionCreationFlag.EXPLICIT_BATCH))
@@ -551,34 +782,80 @@ def torch2trt(module,
 
             ctx.add_inputs(inputs, input_names)
 
-            outputs = module(*inputs)
+            # the trace only needs values, don't record autograd history
+            with torch.no_grad():
+                outputs = module(*inputs)
 
             if not isinstance(outputs, tuple) and not isinstance(outputs, list):
                 outputs = (outputs,)
+            if output_names is None:
+                output_names = default_output_names(len(outputs))
             ctx.mark_outputs(outputs, output_names)
-    if trt_version() >= '8.0' :
+
+    if int8_mode:
+
+        # default to use input tensors for calibration
+        if int8_calib_dataset is None:
+            int8_calib_dataset = TensorBatchDataset(inputs_in)
+
+        # default to calibrating in batches of up to max_batch_size, visiting each sample once
+        if int8_calib_batch_size is None:
+            int8_calib_batch_size = 1
+            if hasattr(int8_calib_dataset, '__len__'):
+                int8_calib_batch_size = default_calibration_batch_size(len(int8_calib_dataset), max_batch_size)
+
+    if trt_version_ge('8.0'):
         config = builder.create_builder_config()
         config.max_workspace_size = max_workspace_size
         config.flags = fp16_mode << int(trt.BuilderFlag.FP16) | strict_type_constraints << int(trt.BuilderFlag.STRICT_TYPES)
         builder.max_batch_size = max_batch_size
 
-        if int8_mode:
+        if sparse_weights:
+            config.flags = config.flags | 1 << int(trt.BuilderFlag.SPARSE_WEIGHTS)
+        if bf16_mode:
+            if not hasattr(trt.BuilderFlag, 'BF16'):
+                raise RuntimeError("bf16_mode is not supported by TensorRT %s" % trt_version())
+            config.flags = config.flags | 1 << int(trt.BuilderFlag.BF16)
+        if hasattr(config, 'builder_optimization_level'):
+            config.builder_optimization_level = optimization_level
+        elif optimization_level != 3:
+            warnings.warn("optimization_level requires TensorRT 8.6 or newer and is ignored")
+
+        # reuse tactic timings from previous builds
+        if timing_cache_path is not None:
+            timing_cache_bytes = b""
+            if os.path.exists(timing_cache_path):
+                with open(timing_cache_path, 'rb') as f:
+                    timing_cache_bytes = f.read()
+            timing_cache = config.create_timing_cache(timing_cache_bytes)
+            config.set_timing_cache(timing_cache, ignore_mismatch=True)
 
-            # default to use input tensors for calibration
-            if int8_calib_dataset is None:
-                int8_calib_dataset = TensorBatchDataset(inputs_in)
+        if int8_mode:
 
             config.flags = config.flags | int8_mode << int(trt.BuilderFlag.INT8)
 
             #Making sure not to run calibration with QAT mode on 
             if not 'qat_mode' in kwargs:
-                # @TODO(jwelsh):  Should we set batch_size=max_batch_size?  Need to investigate memory consumption
                 config.int8_calibrator = DatasetCalibrator(
-                    inputs, int8_calib_dataset, batch_size=int8_calib_batch_size, algorithm=int8_calib_algorithm
+                    inputs, int8_calib_dataset, batch_size=int8_calib_batch_size, algorithm=int8_calib_algorithm,
+                    cache_file=int8_calib_cache_file
                 )
 
         engine = builder.build_engine(network, config)
+
+        if timing_cache_path is not None:
+            with open(timing_cache_path, 'wb') as f:
+                f.write(timing_cache.serialize())
     else:
+        if bf16_mode:
+            raise RuntimeError("bf16_mode is not supported by TensorRT %s" % trt_version())
+        if sparse_weights:
+            warnings.warn("sparse_weights requires TensorRT 8.0 or newer and is ignored")
+        if timing_cache_path is not None:
+            warnings.warn("timing_cache_path requires TensorRT 8.0 or newer and is ignored")
+        if optimization_level != 3:
+            warnings.warn("optimization_level requires TensorRT 8.6 or newer and is ignored")
+
         builder.max_workspace_size = max_workspace_size
         builder.fp16_mode = fp16_mode
         builder.max_batch_size = max_batch_size
@@ -586,15 +863,11 @@ def torch2trt(module,
     
         if int8_mode:
         
-            # default to use input tensors for calibration
-            if int8_calib_dataset is None:
-                int8_calib_dataset = TensorBatchDataset(inputs_in)
-    
             builder.int8_mode = True
     
-            # @TODO(jwelsh):  Should we set batch_size=max_batch_size?  Need to investigate memory consumption
             builder.int8_calibrator = DatasetCalibrator(
-                inputs, int8_calib_dataset, batch_size=int8_calib_batch_size, algorithm=int8_calib_algorithm
+                inputs, int8_calib_dataset, batch_size=int8_calib_batch_size, algorithm=int8_calib_algorithm,
+                cache_file=int8_calib_cache_file
             )
     
         engine = builder.build_cuda_engine(network)
@@ -624,15 +897,21 @@ def get_module_qualname(name):
     raise RuntimeError("Could not import module")
     
 
-def tensorrt_converter(method, is_real=True, enabled=True, imports=[]):
+def tensorrt_converter(method, is_real=True, enabled=True, imports=[], snapshot=False):
     
     if isinstance(method, str):
         module, module_name, qual_name = get_module_qualname(method)
     else:
         module, module_name, qual_name = importlib.import_module(method.__module__), method.__module__, method.__qualname__
         
+    # resolve the object owning the method once, so hooks can patch it with setattr
+    parts = qual_name.split('.')
+    attr_name = parts[-1]
     try:
-        method_impl = eval('copy.deepcopy(module.%s)' % qual_name)
+        parent = functools.reduce(getattr, parts[:-1], module)
+        method_impl = getattr(parent, attr_name)
+        if snapshot:
+            method_impl = copy.deepcopy(method_impl)
     except:
         enabled = False
     
@@ -643,6 +922,8 @@ def tensorrt_converter(method, is_real=True, enabled=True, imports=[]):
             "module": module,
             "module_name": module_name,
             "qual_name": qual_name,
+            "parent": parent,
+            "attr_name": attr_name,
             "method_str": module_name + '.' + qual_name,
             "method_impl": method_impl
         }
@@ -657,3 +938,73 @@ def tensorrt_converter(method, is_real=True, enabled=True, imports=[]):
         return pass_converter
 
     return register_converter
+
+
+_NP_TO_PLUGIN_FIELD_TYPE = {
+    np.int8: trt.PluginFieldType.INT8,
+    np.int16: trt.PluginFieldType.INT16,
+    np.int32: trt.PluginFieldType.INT32,
+    np.float16: trt.PluginFieldType.FLOAT16,
+    np.float32: trt.PluginFieldType.FLOAT32,
+    np.float64: trt.PluginFieldType.FLOAT64,
+}
+
+
+def _plugin_field(name, value):
+    """Creates a TensorRT plugin field from a string, scalar or array value"""
+    if isinstance(value, str):
+        array = np.frombuffer(value.encode() + b"\0", dtype=np.int8)
+        return trt.PluginField(name, array, trt.PluginFieldType.CHAR), array
+    array = np.ascontiguousarray(value)
+    # plugin creators generally read int32 and float32 fields, narrow python ints, floats and bools
+    if array.dtype == np.int64 or array.dtype == np.bool_:
+        array = array.astype(np.int32)
+    elif array.dtype == np.float64:
+        array = array.astype(np.float32)
+    if array.dtype.type not in _NP_TO_PLUGIN_FIELD_TYPE:
+        raise TypeError("%s is not supported as a plugin field type" % array.dtype)
+    return trt.PluginField(name, array, _NP_TO_PLUGIN_FIELD_TYPE[array.dtype.type]), array
+
+
+def tensorrt_plugin_converter(method, plugin_creator_name, plugin_namespace='', plugin_version='1',
+                              fields=None, is_real=True, enabled=True):
+    """Registers a converter that maps a PyTorch method to a TensorRT plugin
+
+    The plugin creator is looked up in the TensorRT plugin registry at conversion time, so the
+    library providing it may be loaded after registration.  ``fields`` is an optional function
+    taking the ConversionContext and returning a dict of plugin field values (strings, scalars
+    or arrays).  Tensor arguments of the method, positional first, become the plugin inputs and
+    its returned tensor(s) the plugin outputs.
+    """
+
+    def convert_plugin(ctx):
+        creator = trt.get_plugin_registry().get_plugin_creator(
+            plugin_creator_name, plugin_version, plugin_namespace)
+        if creator is None:
+            raise RuntimeError("Could not find TensorRT plugin creator %s (version %s, namespace '%s')"
+                               % (plugin_creator_name, plugin_version, plugin_namespace))
+
+        # keep field arrays referenced until the plugin is created
+        plugin_fields, arrays = [], []
+        if fields is not None:
+            for name, value in fields(ctx).items():
+                field, array = _plugin_field(name, value)
+                plugin_fields.append(field)
+                arrays.append(array)
+        plugin = creator.create_plugin(plugin_creator_name, trt.PluginFieldCollection(plugin_fields))
+
+        inputs = [arg for arg in ctx.method_args if isinstance(arg, torch.Tensor)]
+        inputs += [arg for arg in ctx.method_kwargs.values() if isinstance(arg, torch.Tensor)]
+        inputs_trt = [add_missing_trt_tensors(ctx.network, [t])[0] for t in inputs]
+
+        layer = ctx.network.add_plugin_v2(inputs_trt, plugin)
+
+        outputs = ctx.method_return
+        if not isinstance(outputs, tuple) and not isinstance(outputs, list):
+            outputs = (outputs,)
+        for i, output in enumerate(outputs):
+            output._trt = layer.get_output(i)
+
+    convert_plugin.__name__ = 'convert_%s_plugin' % plugin_creator_name
+
+    return tensorrt_converter(method, is_real=is_real, enabled=enabled)(convert_plugin)